@@ -11,6 +11,7 @@ import inspect
 import logging
 import os
 from collections import defaultdict
+from functools import lru_cache
 
 import yaml
 
@@ -113,7 +114,8 @@ def _load_yaml_files():
     return YAML_FILES
 
 
-def get_data_entry(kind, name):
+@lru_cache(maxsize=256)
+def _data_entry_choices(kind, name):
     files = _load_yaml_files()
 
     if kind not in files:
@@ -128,7 +130,11 @@ def get_data_entry(kind, name):
             )
         )
 
-    choices = files[kind][name].choices()
+    return files[kind][name].choices()
+
+
+def get_data_entry(kind, name):
+    choices = _data_entry_choices(kind, name)
 
     if len(choices) == 1:
         return list(choices.values())[0]
@@ -166,3 +172,4 @@ def data_entries(kind=None):
 def clear_cache():
     global YAML_FILES
     YAML_FILES = None
+    _data_entry_choices.cache_clear()
@@ -6,34 +6,51 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 #
+import json
 import os
 from collections import defaultdict
 
-import yaml
-
 from climetlab.decorators import locked
 
 MAGICS_KEYS = None
+MAGICS_UNIQUE_KEYS = None
 MAGICS_DEF = None
 MAGICS_PARAMS = None
 _inited = False
 
 
+def _load_magics_definitions():
+    # magics.json is generated from magics.yaml by tools/magics-yaml-to-json.py
+    with open(os.path.join(os.path.dirname(__file__), "magics.json")) as f:
+        return json.load(f)
+
+
 @locked
 def init():
-    global _inited, MAGICS_KEYS, MAGICS_DEF, MAGICS_PARAMS
+    global _inited, MAGICS_KEYS, MAGICS_UNIQUE_KEYS, MAGICS_DEF, MAGICS_PARAMS
 
     if not _inited:
 
         MAGICS_KEYS = defaultdict(set)
         MAGICS_PARAMS = defaultdict(dict)
-        with open(os.path.join(os.path.dirname(__file__), "magics.yaml")) as f:
-            MAGICS_DEF = yaml.load(f, Loader=yaml.SafeLoader)
-            for action, params in MAGICS_DEF.items():
-                for param in params:
-                    name = param["name"]
-                    MAGICS_KEYS[name].add(action)
-                    MAGICS_PARAMS[action][name] = param
+        MAGICS_DEF = _load_magics_definitions()
+        for action, params in MAGICS_DEF.items():
+            for param in params:
+                name = param["name"]
+                MAGICS_KEYS[name].add(action)
+                MAGICS_PARAMS[action][name] = param
+
+        # The table is read-only from now on
+        MAGICS_KEYS = {
+            name: tuple(sorted(actions)) for name, actions in MAGICS_KEYS.items()
+        }
+
+        # Parameters that belong to a single action
+        MAGICS_UNIQUE_KEYS = {
+            name: actions[0]
+            for name, actions in MAGICS_KEYS.items()
+            if len(actions) == 1
+        }
 
     _inited = True
 
@@ -43,6 +60,11 @@ def magics_keys_to_actions():
     return MAGICS_KEYS
 
 
+def magics_unique_keys_to_actions():
+    init()
+    return MAGICS_UNIQUE_KEYS
+
+
 def magics_keys_definitions():
     init()
     return MAGICS_DEF
@@ -13,6 +13,8 @@
 
 import logging
 
+from climetlab.decorators import locked
+
 from .convertions import convert
 
 LOG = logging.getLogger(__name__)
@@ -25,17 +27,36 @@ class NoMagics:
         )
 
 
-try:
-    import Magics
-    from Magics import macro
+MACRO = None
+
+
+@locked
+def _load_macro():
+    global MACRO
+
+    # Check again, another thread may have loaded Magics while we waited
+    if MACRO is None:
+        try:
+            import Magics
+            from Magics import macro
+
+            try:
+                Magics.strict_mode()
+            except Exception as e:
+                LOG.warning(str(e))
+        except Exception as e:
+            LOG.warning(str(e))
+            macro = NoMagics()
+
+        MACRO = macro
+
 
-    try:
-        Magics.strict_mode()
-    except Exception as e:
-        LOG.warning(str(e))
-except Exception as e:
-    LOG.warning(str(e))
-    macro = NoMagics()
+def _macro():
+    # Loading Magics is expensive, only do it when something is plotted.
+    # The lock is only taken for that first load.
+    if MACRO is None:
+        _load_macro()
+    return MACRO
 
 
 LOG = logging.getLogger(__name__)
@@ -47,13 +68,17 @@ class Action:
 
     def __init__(self, **kwargs):
         self.kwargs = kwargs
+        self._repr = None
 
     def __repr__(self):
-        x = ["macro.%s(" % (self.action,)]
-        for k, v in sorted(self.kwargs.items()):
-            x.append("\n   %s=%r," % (k, v))
-        x.append("\n    )")
-        return "".join(x)
+        # Cached until the next call to `update()`
+        if self._repr is None:
+            x = ["macro.%s(" % (self.action,)]
+            for k, v in sorted(self.kwargs.items()):
+                x.append("\n   %s=%r," % (k, v))
+            x.append("\n    )")
+            self._repr = "".join(x)
+        return self._repr
 
     def to_yaml(self):
         return {self.action: self.kwargs}
@@ -63,20 +88,23 @@ class Action:
         return self.__class__.__name__
 
     def execute(self):
-        return getattr(macro, self.action)(
+        return getattr(_macro(), self.action)(
             **convert(self.action, self.kwargs)
         ).execute()
 
     def update(self, action, values):
         if not isinstance(self, action):
             return None
+        self._repr = None
+        kwargs = self.kwargs
         for k, v in values.items():
-            if k[0] in ("+",):
-                self.kwargs[k[1:]] = v
-            if k[0] in ("-",):
-                self.kwargs.pop(k[1:], None)
-            if k[0] in ("=",) and k[1:] not in self.kwargs:
-                self.kwargs[k[1:]] = v
+            c, key = k[0], k[1:]
+            if c == "+":
+                kwargs[key] = v
+            elif c == "-":
+                kwargs.pop(key, None)
+            elif c == "=" and key not in kwargs:
+                kwargs[key] = v
         return self
 
 
@@ -131,8 +159,25 @@ class output(Action):  # noqa: N801
 
 
 def plot(*args, **kwargs):
-    return macro.plot(*args, **kwargs)
+    return _macro().plot(*args, **kwargs)
+
+
+ACTIONS = {
+    cls.__name__: cls
+    for cls in (
+        mcont,
+        mcoast,
+        mmap,
+        mgrib,
+        mnetcdf,
+        minput,
+        mtable,
+        mtext,
+        msymb,
+        output,
+    )
+}
 
 
 def lookup(name):
-    return globals()[name]
+    return ACTIONS[name]
@@ -7,55 +7,73 @@
 # nor does it submit to any jurisdiction.
 #
 
+import heapq
 import logging
+import operator
 from collections import defaultdict
 
 from climetlab.core.data import get_data_entry
 
-from . import magics_keys_to_actions
+from . import magics_unique_keys_to_actions
 from .actions import lookup
 
 LOG = logging.getLogger(__name__)
 
+# Prefixes used to update ('+'), remove ('-') or default ('=') attributes
+SPECIAL_PREFIXES = frozenset("+-=")
+
 
 def _find_action(value, action):
 
-    magics_keys = magics_keys_to_actions()
+    magics_keys = magics_unique_keys_to_actions()
 
     # Guess the best action from the keys
     scores = defaultdict(int)
     special = 0
     for param in value.keys():
 
-        if not param[0].isalpha():
+        if param[0] in SPECIAL_PREFIXES:
             special += 1
             param = param[1:]
 
-        acts = magics_keys.get(param, [])
-        if len(acts) == 1:
-            # Only consider unambiguous parameters
-            scores[list(acts)[0]] += 1
+        # Only consider unambiguous parameters
+        act = magics_keys.get(param)
+        if act is not None:
+            scores[act] += 1
 
-    best = sorted((v, k) for k, v in scores.items())
+    # Only the two best scores are needed to detect ties
+    top = heapq.nlargest(2, scores.items(), key=operator.itemgetter(1))
 
-    if len(best) == 0:
-        LOG.warning("Cannot establish Magics action from [%r]", list(value.keys()))
+    if len(top) == 0:
+        LOG.warning("Cannot establish Magics action from [%r]", list(value))
 
-    if len(best) >= 2 and best[0][0] == best[1][0]:
+    elif len(top) >= 2 and top[0][1] == top[1][1]:
         LOG.warning(
             "Cannot establish Magics action from [%r], it could be %s or %s",
-            list(value.keys()),
-            best[0][1],
-            best[1][1],
+            list(value),
+            top[0][0],
+            top[1][0],
         )
 
-    if len(best) > 0:
-        action = lookup(best[0][1])
+    if len(top) > 0:
+        action = lookup(top[0][0])
 
     return action, special
 
 
-def _apply_dict(*, value, collection, action, default, target, options):  # noqa C901
+def _prefixed(updates, removals):
+    newvalue = {}
+    for k, v in updates.items():
+        newvalue["+{}".format(k)] = v
+
+    for k in removals:
+        newvalue["-{}".format(k)] = None
+
+    return newvalue
+
+
+def _expand_updates(value):
+    # Rewrite the structured forms of updates into prefixed attributes
 
     if "update" in value:
         newvalue = {}
@@ -64,55 +82,26 @@ def _apply_dict(*, value, collection, action, default, target, options):  # noqa
                 newvalue["-{}".format(k)] = v
             else:
                 newvalue["+{}".format(k)] = v
-
-        return apply(
-            value=newvalue,
-            collection=collection,
-            action=action,
-            default=default,
-            target=target,
-            options=options,
-        )
+        return newvalue
 
     if "set" in value or "clear" in value:
-        newvalue = {}
-        for k, v in value.get("set", {}).items():
-            newvalue["+{}".format(k)] = v
+        return _prefixed(value.get("set", {}), value.get("clear", []))
 
-        for k in value.get("clear", []):
-            newvalue["-{}".format(k)] = None
+    if "+" in value or "-" in value:
+        return _prefixed(value.get("+", {}), value.get("-", []))
 
-        return apply(
-            value=newvalue,
-            collection=collection,
-            action=action,
-            default=default,
-            target=target,
-            options=options,
-        )
+    return value
 
-    if "+" in value or "-" in value:
-        newvalue = {}
-        for k, v in value.get("+", {}).items():
-            newvalue["+{}".format(k)] = v
 
-        for k in value.get("-", []):
-            newvalue["-{}".format(k)] = None
+def _apply_dict(*, value, collection, action, default, target, options):
 
-        return apply(
-            value=newvalue,
-            collection=collection,
-            action=action,
-            default=default,
-            target=target,
-            options=options,
-        )
+    value = _expand_updates(value)
 
     action, special = _find_action(value, action)
     if special:
         if special != len(value):
             raise ValueError(
-                "Cannot set some attributes and override others %r" % list(value.keys())
+                "Cannot set some attributes and override others %r" % list(value)
             )
 
         result = target.update(action, value)
@@ -120,7 +109,7 @@ def _apply_dict(*, value, collection, action, default, target, options):  # noqa
             return result
 
         raise ValueError(
-            "Cannot override attributes %r (no matching style)" % list(value.keys())
+            "Cannot override attributes %r (no matching style)" % list(value)
         )
 
     return action(**value)
@@ -8,8 +8,7 @@
 #
 
 import logging
-
-import yaml
+import os
 
 from climetlab.core.ipython import SVG, Image
 from climetlab.core.metadata import annotation
@@ -21,6 +20,21 @@ from .apply import apply
 
 LOG = logging.getLogger(__name__)
 
+# Coastline settings shared by the borders, rivers and cities overlays
+_COAST_BASE = dict(map_grid=False, map_coastline=False, map_label=False)
+
+# Options applied by `Driver.finalise()`, in order, and the methods handling them
+_OPTION_HANDLERS = {
+    "style": "style",
+    "bounding_box": "_bounding_box_option",
+    "background": "background",
+    "foreground": "foreground",
+    "projection": "projection",
+}
+
+# Options that can also be given with each call to `plot_map()`
+_LAYER_OPTIONS = ("style", "bounding_box")
+
 
 class Layer:
     def __init__(self, data):
@@ -115,20 +129,13 @@ class Driver:
 
     def plot_netcdf(self, path: str, variable: str, dimensions: dict = None):
 
-        if dimensions is None:
-            dimensions = {}
-
-        dimension_setting = ["%s:%s" % (k, v) for k, v in dimensions.items()]
+        params = dict(netcdf_filename=path, netcdf_value_variable=variable)
 
-        if dimension_setting:
-            params = dict(
-                netcdf_filename=path,
-                netcdf_value_variable=variable,
-                netcdf_dimension_setting=dimension_setting,
-                netcdf_dimension_setting_method="index",
-            )
-        else:
-            params = dict(netcdf_filename=path, netcdf_value_variable=variable)
+        if dimensions:
+            params["netcdf_dimension_setting"] = [
+                f"{k}:{v}" for k, v in dimensions.items()
+            ]
+            params["netcdf_dimension_setting_method"] = "index"
 
         self._push_layer(mnetcdf(**params))
 
@@ -137,6 +144,8 @@ class Driver:
         data,
         metadata: dict = None,
     ):
+        import numpy as np
+
         if metadata is None:
             metadata = {}
 
@@ -164,6 +173,11 @@ class Driver:
                     r[k] = v
             return r
 
+        # Magics expects a contiguous array of floats or doubles
+        data = np.ascontiguousarray(
+            data, dtype=np.float32 if data.dtype == np.float32 else np.float64
+        )
+
         self._push_layer(
             minput(
                 input_field=data,
@@ -185,7 +199,12 @@ class Driver:
             if aux in field.attrs:
                 dataset = dataset.assign(aux=ds[aux].data)
 
-        dataset.to_netcdf(tmp)
+        try:
+            # NetCDF-3 is much cheaper to write than HDF5 based NetCDF-4
+            dataset.to_netcdf(tmp, engine="scipy")
+        except (ImportError, TypeError, ValueError):
+            dataset.to_netcdf(tmp)
+
         self.plot_netcdf(tmp, variable, {} if dimensions is None else dimensions)
 
     def plot_csv(self, path: str, variable: str):
@@ -202,8 +221,21 @@ class Driver:
         self.style("default-style-observations")
 
     def plot_pandas(self, frame, latitude: str, longitude: str, variable: str):
+        import numpy as np
+
         tmp = self.temporary_file(".csv")
-        frame[[latitude, longitude, variable]].to_csv(tmp, header=False, index=False)
+        columns = frame[[latitude, longitude, variable]]
+        try:
+            values = columns.to_numpy(dtype=np.float64, copy=False)
+        except (TypeError, ValueError):
+            values = None
+
+        if values is not None and np.isfinite(values).all():
+            np.savetxt(tmp, values, delimiter=",", fmt="%.8g")
+        else:
+            # Not purely numerical, or with missing values that pandas
+            # writes as empty fields
+            columns.to_csv(tmp, header=False, index=False)
         self.plot_csv(tmp, variable)
 
         style = annotation(frame).get("style")
@@ -252,69 +284,53 @@ class Driver:
         else:
             raise Exception("No current data layer: cannot set style '%r'" % (style,))
 
-    def apply_options(self, options):
-        if options.provided("style"):
-            self.style(options["style"])
+    def _bounding_box_option(self, bbox):
+        if isinstance(bbox, (list, tuple)):
+            self.bounding_box(north=bbox[0], west=bbox[1], south=bbox[2], east=bbox[3])
+        else:
+            self.bounding_box(
+                north=bbox.north, west=bbox.west, south=bbox.south, east=bbox.east
+            )
 
-        if options.provided("bounding_box"):
-            bbox = options["bounding_box"]
-            if isinstance(bbox, (list, tuple)):
-                self.bounding_box(
-                    north=bbox[0], west=bbox[1], south=bbox[2], east=bbox[3]
-                )
-            else:
-                self.bounding_box(
-                    north=bbox.north, west=bbox.west, south=bbox.south, east=bbox.east
-                )
+    def apply_options(self, options, names=_LAYER_OPTIONS):
+        for name in names:
+            if options.provided(name):
+                getattr(self, _OPTION_HANDLERS[name])(options[name])
 
     def option(self, name, default=None):
         return self._options(name, default)
 
     def finalise(self):
-        self.apply_options(self._options)
-
-        if self._options.provided("background"):
-            self.background(self._options["background"])
-
-        if self._options.provided("foreground"):
-            self.foreground(self._options["foreground"])
-
-        if self._options.provided("projection"):
-            self.projection(self._options["projection"])
+        self.apply_options(self._options, _OPTION_HANDLERS)
 
         if self._options("grid", False):
             self._grid = mcoast(map_grid=True, map_coastline=False)
 
         if self._options("borders", False):
-            self._borders = mcoast(
-                map_boundaries=True,
-                map_grid=False,
-                map_coastline=False,
-                map_label=False,
-            )
+            self._borders = mcoast(map_boundaries=True, **_COAST_BASE)
 
         if self._options("rivers", False):
-            self._rivers = mcoast(
-                map_rivers=True, map_grid=False, map_coastline=False, map_label=False
-            )
+            self._rivers = mcoast(map_rivers=True, **_COAST_BASE)
 
         if self._options("cities", False):
-            self._cities = mcoast(
-                map_cities=True, map_label=False, map_grid=False, map_coastline=False
-            )
+            self._cities = mcoast(map_cities=True, **_COAST_BASE)
 
     def show(self):
         width = self._options("width", 680)
 
-        path = self._options(
-            "path", self.temporary_file("." + self._options("format", "png"))
-        )
+        fmt = self._options("format", "png")
+        path = self._options("path", None)
+        if path is None:
+            path = self.temporary_file("." + fmt)
 
         self.save(path)
 
-        if path.endswith(".svg"):
+        _, ext = os.path.splitext(path)
+        ext = ext.lower()
+
+        if ext == ".svg":
             Display = SVG  # noqa: N806
-        elif path.endswith(".pdf"):
+        elif ext == ".pdf":
             return path
         else:
             Display = Image  # noqa: N806
@@ -372,14 +388,17 @@ class Driver:
                     # text_colour='charcoal'
                 )
 
+        width_cm = self._width_cm
+        height_cm = self._height_cm * self._page_ratio
+
         page = output(
             output_file=path,
-            page_x_length=self._width_cm,
-            page_y_length=self._height_cm * self._page_ratio,
-            super_page_x_length=self._width_cm,
-            super_page_y_length=self._height_cm * self._page_ratio + _title_height_cm,
-            subpage_x_length=self._width_cm,
-            subpage_y_length=self._height_cm * self._page_ratio,
+            page_x_length=width_cm,
+            page_y_length=height_cm,
+            super_page_x_length=width_cm,
+            super_page_y_length=height_cm + _title_height_cm,
+            subpage_x_length=width_cm,
+            subpage_y_length=height_cm,
             subpage_x_position=0.0,
             subpage_y_position=0.0,
             output_width=width,
@@ -406,6 +425,8 @@ class Driver:
 
         dump = self._options("dump_yaml", False)
         if dump:
+            import yaml
+
             if isinstance(dump, str):
                 with open(dump, "w") as f:
                     print(
@@ -438,10 +459,19 @@ class Driver:
         :return: A list of plotting directives
         :rtype: list
         """
-        m = [self._projection, self._background]
+        m = []
+        append = m.append
+
+        if self._projection is not None:
+            append(self._projection)
+
+        if self._background is not None:
+            append(self._background)
+
         for r in self._layers:
             r.add_action(m)
-        m += [
+
+        for x in (
             self._rivers,
             self._borders,
             self._cities,
@@ -449,8 +479,11 @@ class Driver:
             self._grid,
             self._legend,
             self._title,
-        ]
-        return [x for x in m if x is not None]
+        ):
+            if x is not None:
+                append(x)
+
+        return m
 
     def wms_layers(self):
 
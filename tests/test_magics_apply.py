@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import logging
+
+from climetlab.plotting.drivers.magics.actions import mcont, mmap
+from climetlab.plotting.drivers.magics.apply import _find_action
+
+
+def test_find_action_majority(caplog):
+    value = {
+        "contour_shade": True,
+        "contour_label": False,
+        "subpage_map_projection": "cylindrical",
+    }
+
+    with caplog.at_level(logging.WARNING):
+        assert _find_action(value, None) == (mcont, 0)
+
+    assert "Cannot establish Magics action" not in caplog.text
+
+
+def test_find_action_tie(caplog):
+    value = {
+        "contour_shade": True,
+        "subpage_map_projection": "cylindrical",
+    }
+
+    with caplog.at_level(logging.WARNING):
+        action, special = _find_action(value, None)
+
+    assert action in (mcont, mmap)
+    assert special == 0
+    assert "it could be" in caplog.text
+    assert "mcont" in caplog.text and "mmap" in caplog.text
+
+
+if __name__ == "__main__":
+    from climetlab.testing import main
+
+    main(globals())
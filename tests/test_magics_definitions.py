@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import json
+import os
+
+import yaml
+
+import climetlab.plotting.drivers.magics as magics
+
+
+def test_magics_json_up_to_date():
+    # Run tools/magics-yaml-to-json.py if this fails
+    directory = os.path.dirname(magics.__file__)
+
+    with open(os.path.join(directory, "magics.yaml")) as f:
+        expected = yaml.load(f, Loader=yaml.SafeLoader)
+
+    with open(os.path.join(directory, "magics.json")) as f:
+        assert json.load(f) == expected
+
+
+def test_magics_unique_keys():
+    keys = magics.magics_keys_to_actions()
+    unique = magics.magics_unique_keys_to_actions()
+
+    assert unique["contour_shade"] == "mcont"
+    for name, action in unique.items():
+        assert keys[name] == (action,)
+
+
+if __name__ == "__main__":
+    from climetlab.testing import main
+
+    main(globals())
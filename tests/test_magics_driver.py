@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import numpy as np
+import pandas as pd
+
+from climetlab.plotting.drivers.magics.driver import Driver
+from climetlab.plotting.options import Options
+
+
+def _pandas_csv(frame):
+    driver = Driver(Options({}))
+    driver.plot_pandas(frame, "lat", "lon", "t")
+    with open(driver._tmp[-1].path) as f:
+        return f.read().splitlines()
+
+
+def test_plot_pandas_numerical():
+    frame = pd.DataFrame(dict(lat=[46.2, 45.5], lon=[2.0, 3.25], t=[280.5, 281.0]))
+    assert _pandas_csv(frame) == ["46.2,2,280.5", "45.5,3.25,281"]
+
+
+def test_plot_pandas_missing_values():
+    frame = pd.DataFrame(dict(lat=[46.2, 45.5], lon=[2.0, 3.25], t=[np.nan, 281.0]))
+    assert _pandas_csv(frame) == ["46.2,2.0,", "45.5,3.25,281.0"]
+
+
+if __name__ == "__main__":
+    from climetlab.testing import main
+
+    main(globals())
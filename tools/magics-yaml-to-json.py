@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+# magics.yaml is the source of the Magics parameter definitions. Run this
+# script each time it is modified to regenerate magics.json, which is the
+# file loaded at runtime.
+
+import json
+import os
+
+import yaml
+
+DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "climetlab",
+    "plotting",
+    "drivers",
+    "magics",
+)
+
+with open(os.path.join(DIRECTORY, "magics.yaml")) as f:
+    magics = yaml.load(f, Loader=yaml.SafeLoader)
+
+with open(os.path.join(DIRECTORY, "magics.json"), "w") as f:
+    json.dump(magics, f, indent=2)
+    print(file=f)